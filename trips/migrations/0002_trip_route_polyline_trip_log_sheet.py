@@ -0,0 +1,23 @@
+# Generated by Django 5.0 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trip',
+            name='route_polyline',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='trip',
+            name='log_sheet',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
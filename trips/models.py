@@ -9,6 +9,11 @@ class Trip(models.Model):
     distance_miles = models.FloatField(default=0)
     duration_hours = models.FloatField(default=0)
 
+    # Route geometry as a Google encoded polyline (delta-encoded, ~1.1 m precision).
+    # Much smaller than a JSON list of [lat, lon] pairs; decoded on replay.
+    route_polyline = models.TextField(blank=True, default="")
+    log_sheet = models.JSONField(default=dict, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -4,6 +4,8 @@ from typing import Dict, List, Tuple, Any, Optional
 
 import requests
 
+from .polyline import simplify_polyline
+
 
 # ========= CONFIG =========
 # IMPORTANT: Nominatim requires a real contact in User-Agent (email or website).
@@ -139,7 +141,11 @@ def _osrm_route(session: requests.Session, start_latlon: Tuple[float, float], en
     return distance_miles, duration_hours, latlon
 
 
-def _assemble(distance_miles: float, duration_hours: float, route: List[List[float]], pickup: str, dropoff: str) -> Dict[str, Any]:
+def build_map_info(route: List[List[float]], pickup: str, dropoff: str, simplify_tolerance: float = 0.0) -> Dict[str, Any]:
+    """
+    Shape MapDisplay.js expects. Also used to replay a stored trip without calling OSRM again.
+    Stops/center are taken from the full route; only the drawn line is simplified.
+    """
     if not route:
         raise MapServiceError("Cannot assemble map info: route is empty.")
 
@@ -150,14 +156,18 @@ def _assemble(distance_miles: float, duration_hours: float, route: List[List[flo
         {"pos": route[-1], "label": f"Dropoff: {dropoff}"},
     ]
 
+    return {
+        "route": simplify_polyline(route, simplify_tolerance),
+        "stops": stops,
+        "mapCenter": mid,
+    }
+
+
+def _assemble(distance_miles: float, duration_hours: float, route: List[List[float]], pickup: str, dropoff: str) -> Dict[str, Any]:
     return {
         "distance_miles": round(distance_miles, 2),
         "duration_hours": round(duration_hours, 2),
-        "mapInfo": {
-            "route": route,
-            "stops": stops,
-            "mapCenter": mid,
-        },
+        "mapInfo": build_map_info(route, pickup, dropoff),
     }
 
 
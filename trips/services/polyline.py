@@ -0,0 +1,99 @@
+from typing import List
+
+
+# Google encoded polyline, precision 5 (~1.1 m) — same format OSRM/Leaflet plugins understand.
+PRECISION = 5
+_FACTOR = 10 ** PRECISION
+
+
+def _encode_value(value: int, out: List[str]) -> None:
+    # zig-zag the sign into the low bit, then emit 5-bit chunks
+    value = ~(value << 1) if value < 0 else (value << 1)
+    while value >= 0x20:
+        out.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    out.append(chr(value + 63))
+
+
+def encode_polyline(points: List[List[float]]) -> str:
+    """
+    [[lat, lon], ...] -> encoded polyline string.
+    Each coordinate is stored as a delta from the previous one, so long routes stay small.
+    """
+    out: List[str] = []
+    prev_lat = prev_lon = 0
+    for lat, lon in points:
+        ilat = int(round(lat * _FACTOR))
+        ilon = int(round(lon * _FACTOR))
+        _encode_value(ilat - prev_lat, out)
+        _encode_value(ilon - prev_lon, out)
+        prev_lat, prev_lon = ilat, ilon
+    return "".join(out)
+
+
+def decode_polyline(encoded: str) -> List[List[float]]:
+    """Encoded polyline string -> [[lat, lon], ...]"""
+    points: List[List[float]] = []
+    index = 0
+    lat = lon = 0
+    length = len(encoded)
+
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                b = ord(encoded[index]) - 63
+                index += 1
+                result |= (b & 0x1F) << shift
+                shift += 5
+                if b < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else (result >> 1))
+        lat += deltas[0]
+        lon += deltas[1]
+        points.append([lat / _FACTOR, lon / _FACTOR])
+
+    return points
+
+
+def simplify_polyline(points: List[List[float]], tolerance: float) -> List[List[float]]:
+    """
+    Douglas-Peucker simplification. `tolerance` is in degrees (0.0001 ≈ 11 m).
+    First and last points are always kept.
+    """
+    if tolerance <= 0 or len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    tol_sq = tolerance * tolerance
+    stack = [(0, len(points) - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        seg_len_sq = dx * dx + dy * dy
+
+        max_dist_sq = 0.0
+        max_index = first
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if seg_len_sq == 0:
+                ex, ey = px - ax, py - ay
+            else:
+                t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / seg_len_sq))
+                ex, ey = px - (ax + t * dx), py - (ay + t * dy)
+            dist_sq = ex * ex + ey * ey
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                max_index = i
+
+        if max_dist_sq > tol_sq:
+            keep[max_index] = True
+            stack.append((first, max_index))
+            stack.append((max_index, last))
+
+    return [p for p, k in zip(points, keep) if k]
@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import TripPlanView, ping
+from .views import TripPlanView, TripDetailView, ping
 
 urlpatterns = [
     path("plan/", TripPlanView.as_view(), name="trip-plan"),
+    path("<int:pk>/", TripDetailView.as_view(), name="trip-detail"),
     path("ping/", ping, name="ping"),
 ]
 
@@ -2,9 +2,11 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
 from .serializers import TripInputSerializer
 from .models import Trip
-from .services.map_service import generate_route_map
+from .services.map_service import generate_route_map, build_map_info
+from .services.polyline import encode_polyline, decode_polyline
 from .services.log_service import generate_log_sheet
 
 
@@ -22,6 +24,7 @@ class TripPlanView(APIView):
 
     Response:
     {
+      "tripId": 1,
       "logSheet": { ...shape LogSheet.js expects... },
       "mapInfo": { ...shape MapDisplay.js expects... }
     }
@@ -54,24 +57,61 @@ class TripPlanView(APIView):
             current_cycle_used=serializer.validated_data["current_cycle_used"],
         )
 
-        # 3) Save Trip (for history, analytics)
-        Trip.objects.create(
+        # 3) Save Trip (for history, analytics, replay)
+        trip = Trip.objects.create(
             current_location=serializer.validated_data["current_location"],
             pickup_location=serializer.validated_data["pickup_location"],
             dropoff_location=serializer.validated_data["dropoff_location"],
             current_cycle_used=serializer.validated_data["current_cycle_used"],
             distance_miles=distance_miles,
             duration_hours=map_result["duration_hours"],
+            route_polyline=encode_polyline(map_result["mapInfo"]["route"]),
+            log_sheet=log_sheet,
         )
 
         return Response(
             {
+                "tripId": trip.id,
                 "logSheet": log_sheet,
                 "mapInfo": map_result["mapInfo"],
             },
             status=status.HTTP_200_OK,
         )
 
+class TripDetailView(APIView):
+    """
+    GET /api/trips/<id>/?simplify=0.0005
+
+    Replays a saved trip straight from the DB (no OSRM / HOS recompute).
+    Optional `simplify` = Douglas-Peucker tolerance in degrees for the route line.
+
+    Response: same "logSheet" / "mapInfo" shape as TripPlanView.
+    """
+
+    def get(self, request, pk):
+        try:
+            tolerance = float(request.query_params.get("simplify", 0) or 0)
+        except ValueError:
+            tolerance = -1.0
+        if not tolerance >= 0:  # also rejects NaN
+            return Response(
+                {"simplify": ["Must be a non-negative number (degrees)."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        trip = get_object_or_404(Trip, pk=pk)
+        route = decode_polyline(trip.route_polyline)
+
+        return Response(
+            {
+                "tripId": trip.id,
+                "logSheet": trip.log_sheet,
+                "mapInfo": build_map_info(route, trip.pickup_location, trip.dropoff_location, tolerance) if route else None,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 def ping(request):
     return JsonResponse({"status": "ok", "message": "Alive"})
 